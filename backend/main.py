@@ -5,33 +5,45 @@ REST API for the microgrid simulation engine.
 Provides endpoints for running energy simulations with configurable parameters.
 """
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import os
+import threading
+from collections import OrderedDict
+
+import orjson
+from fastapi import Body, FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Dict, Any, List, Tuple
 
-from simulation import MicrogridSimulator, SimulationConfig
+from simulation import MicrogridSimulator, SimulationConfig, simulate_batch
 
 
 # ============================================
 # FastAPI Application Setup
 # ============================================
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (C encoder, native NumPy support)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
 app = FastAPI(
     title="Microgrid Digital Twin API",
     description="Simulate 24-hour microgrid energy cycles with Solar, Battery, and Grid integration",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration - Allow frontend to connect
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",      # Next.js dev server
-        "http://127.0.0.1:3000",
-        "http://localhost:3001",      # Alternative port
-    ],
+    # Next.js dev server (3000) and alternative port (3001) on localhost/127.0.0.1
+    allow_origin_regex=r"^http://(localhost|127\.0\.0\.1):300[01]$",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -98,6 +110,80 @@ class SimulationRequest(BaseModel):
         }
 
 
+# ============================================
+# Response Payloads
+# ============================================
+def _to_config(request: SimulationRequest) -> SimulationConfig:
+    """Create a simulation configuration from request parameters."""
+    return SimulationConfig(
+        battery_capacity_kwh=request.battery_capacity_kwh,
+        solar_capacity_kw=request.solar_capacity_kw,
+        weather_mode=request.weather_mode,
+        off_peak_price=request.off_peak_price,
+        standard_price=request.standard_price,
+        peak_price=request.peak_price,
+        initial_soc=request.initial_soc
+    )
+
+
+# Largest scenario list accepted by /simulate/batch (bounds CPU and response size)
+MAX_BATCH_SIZE = 256
+
+# Pre-encoded responses keyed by config, least recently used first
+_RESPONSE_CACHE: "OrderedDict[SimulationConfig, bytes]" = OrderedDict()
+_RESPONSE_CACHE_SIZE = 512
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _simulate_json(config: SimulationConfig) -> Tuple[bytes, bool]:
+    """
+    Simulation response for a config, pre-encoded as JSON bytes.
+    
+    Cache hits are served without rebuilding or re-encoding the 48 hourly
+    records, so repeated requests allocate almost nothing.
+    
+    Returns:
+        (payload, cached) where cached tells this caller whether the payload
+        came from the cache, independent of concurrent requests
+    """
+    with _RESPONSE_CACHE_LOCK:
+        payload = _RESPONSE_CACHE.get(config)
+        if payload is not None:
+            _RESPONSE_CACHE.move_to_end(config)
+            return payload, True
+    
+    # Simulate outside the lock so misses for different configs run concurrently
+    results = MicrogridSimulator(config).run_comparison()
+    payload = orjson.dumps(results, option=orjson.OPT_SERIALIZE_NUMPY)
+    
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[config] = payload
+        _RESPONSE_CACHE.move_to_end(config)
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+    return payload, False
+
+
+def _default_config() -> Dict[str, Any]:
+    """Build the default simulation configuration payload."""
+    config = SimulationConfig()
+    return {
+        "battery_capacity_kwh": config.battery_capacity_kwh,
+        "battery_efficiency": config.battery_efficiency,
+        "min_soc": config.min_soc,
+        "max_soc": config.max_soc,
+        "initial_soc": config.initial_soc,
+        "peak_price": config.peak_price,
+        "off_peak_price": config.off_peak_price,
+        "peak_hours": config.peak_hours
+    }
+
+
+# Default responses never change, so compute them once at import
+DEFAULT_SIMULATION, _ = _simulate_json(SimulationConfig())
+DEFAULT_CONFIG = _default_config()
+
+
 # ============================================
 # API Endpoints
 # ============================================
@@ -121,28 +207,47 @@ async def run_simulation(request: SimulationRequest = None):
     
     Returns hourly data for both strategies plus summary metrics
     including cost savings and grid usage reduction.
+    
+    The simulation is deterministic in its inputs, so identical requests
+    are served from an in-memory cache (reported via the x-cache header).
     """
     try:
         # Use defaults if no request body provided
         if request is None:
             request = SimulationRequest()
         
-        # Create configuration from request
-        config = SimulationConfig(
-            battery_capacity_kwh=request.battery_capacity_kwh,
-            solar_capacity_kw=request.solar_capacity_kw,
-            weather_mode=request.weather_mode,
-            off_peak_price=request.off_peak_price,
-            standard_price=request.standard_price,
-            peak_price=request.peak_price,
-            initial_soc=request.initial_soc
-        )
+        config = _to_config(request)
         
-        # Run simulation
-        simulator = MicrogridSimulator(config)
-        results = simulator.run_comparison()
+        # Run simulation (memoized per config); CPU-bound on a miss, so run
+        # in a worker thread to keep the event loop free
+        payload, cached = await asyncio.to_thread(_simulate_json, config)
+        cache_status = "hit" if cached else "miss"
         
-        return results
+        return Response(payload, media_type="application/json", headers={"x-cache": cache_status})
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Simulation error: {str(e)}"
+        )
+
+
+@app.post("/simulate/batch")
+async def run_batch_simulation(
+    requests: List[SimulationRequest] = Body(..., max_length=MAX_BATCH_SIZE)
+):
+    """
+    Run many 24-hour simulations in one call (e.g. parameter sweeps).
+    
+    Scenarios are independent and run in a single batched kernel call.
+    Returns one result per request, in order, each shaped like /simulate.
+    At most MAX_BATCH_SIZE scenarios are accepted per call.
+    """
+    try:
+        configs = [_to_config(request) for request in requests]
+        results = await asyncio.to_thread(simulate_batch, configs)
+        
+        return ORJSONResponse(results)
     
     except Exception as e:
         raise HTTPException(
@@ -159,24 +264,13 @@ async def run_default_simulation():
     Convenience endpoint for quick testing without request body.
     Uses: 10 kWh battery, $0.25 peak, $0.10 off-peak pricing.
     """
-    simulator = MicrogridSimulator()
-    return simulator.run_comparison()
+    return Response(DEFAULT_SIMULATION, media_type="application/json")
 
 
 @app.get("/config/defaults")
 async def get_default_config():
     """Get default simulation configuration values."""
-    config = SimulationConfig()
-    return {
-        "battery_capacity_kwh": config.battery_capacity_kwh,
-        "battery_efficiency": config.battery_efficiency,
-        "min_soc": config.min_soc,
-        "max_soc": config.max_soc,
-        "initial_soc": config.initial_soc,
-        "peak_price": config.peak_price,
-        "off_peak_price": config.off_peak_price,
-        "peak_hours": config.peak_hours
-    }
+    return ORJSONResponse(DEFAULT_CONFIG)
 
 
 # ============================================
@@ -184,4 +278,13 @@ async def get_default_config():
 # ============================================
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # Auto-reload is for development only (DEV_RELOAD=1); otherwise run one
+    # worker process per CPU core for the CPU-bound simulation workload
+    reload = os.getenv("DEV_RELOAD") == "1"
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=reload,
+        workers=1 if reload else os.cpu_count()
+    )
@@ -17,13 +17,18 @@ Strategies:
 """
 
 import numpy as np
+from numba import njit, types
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
-    """Configuration parameters for microgrid simulation - Delhi, India context."""
+    """Configuration parameters for microgrid simulation - Delhi, India context.
+    
+    Frozen (hashable) so a config can key the API response cache directly.
+    """
     battery_capacity_kwh: float = 10.0  # Total battery capacity in kWh
     battery_efficiency: float = 0.95    # Round-trip efficiency
     min_soc: float = 0.20               # Minimum State of Charge (20%)
@@ -39,6 +44,269 @@ class SimulationConfig:
     peak_hours: tuple = (18, 22)        # Peak pricing hours (6 PM - 10 PM)
 
 
+# Simulation horizon: hours 0-23, shared read-only by every simulator
+HOURS = np.arange(24, dtype=np.int16)
+HOURS.setflags(write=False)
+
+# Fixed profile noise (constant seeds, reproducible results) drawn once at import
+_SOLAR_NOISE = np.random.default_rng(42).random(24)
+_LOAD_NOISE = np.random.default_rng(43).random(24)
+
+
+# Eager signature: compiled (or loaded from the on-disk cache) at import,
+# so the first request does not pay the JIT cost. Solar/load profiles are
+# the read-only cached arrays, passed without a copy.
+_PROFILE_ARRAY = types.Array(types.float64, 1, "A", readonly=True)
+_RUN_BOTH_SIGNATURE = types.UniTuple(types.float64[:], 12)(
+    _PROFILE_ARRAY, _PROFILE_ARRAY,
+    types.float64, types.float64, types.float64, types.float64, types.float64,
+    types.int64, types.int64
+)
+
+
+@njit(_RUN_BOTH_SIGNATURE, cache=True)
+def _run_both(solar, load, soc0, capacity, efficiency, min_soc, max_soc, peak_lo, peak_hi):
+    """
+    Hour-by-hour baseline and smart dispatch in a single pass, compiled with Numba.
+    
+    The SoC carried from one hour to the next prevents vectorization, so the
+    dispatch rules run as an explicit scalar loop over the horizon. The baseline
+    strategy is computed from the same per-hour solar/load values.
+    
+    Returns:
+        Tuple of 12 hourly arrays, baseline then smart, each group ordered
+        (solar_used, grid_usage, battery_charge, battery_discharge,
+        battery_soc, solar_excess). SoC is a 0-1 fraction.
+    """
+    n = solar.shape[0]
+    base_solar_used_out = np.zeros(n)
+    base_grid_usage_out = np.zeros(n)
+    base_battery_charge_out = np.zeros(n)
+    base_battery_discharge_out = np.zeros(n)
+    base_soc_out = np.full(n, soc0)  # Battery idle in baseline
+    base_solar_excess_out = np.zeros(n)
+    
+    solar_used_out = np.zeros(n)
+    grid_usage_out = np.zeros(n)
+    battery_charge_out = np.zeros(n)
+    battery_discharge_out = np.zeros(n)
+    soc_out = np.zeros(n)
+    solar_excess_out = np.zeros(n)
+    
+    soc = soc0  # Current State of Charge (0-1)
+    
+    for h in range(n):
+        is_peak = peak_lo <= h < peak_hi
+        
+        # ========================================
+        # STEP 1: Direct Solar to Load
+        # ========================================
+        solar_used = min(solar[h], load[h])
+        remaining_load = load[h] - solar_used
+        solar_excess = max(0.0, solar[h] - load[h])
+        
+        # Baseline: grid fills the whole deficit, excess solar is wasted
+        base_solar_used_out[h] = solar_used
+        base_grid_usage_out[h] = remaining_load
+        base_solar_excess_out[h] = solar_excess
+        
+        # ========================================
+        # STEP 2: Handle Solar Excess (Charge Battery)
+        # ========================================
+        # Branchless: no excess or a full battery make the min() yield zero
+        # Calculate available storage capacity
+        available_capacity = max(0.0, (max_soc - soc) * capacity)
+        # Energy that can be stored (accounting for efficiency)
+        energy_to_store = min(solar_excess * efficiency, available_capacity)
+        # Update battery state, clamped to max (never pulls an over-full SoC down)
+        battery_charge = energy_to_store
+        soc = min(soc + energy_to_store / capacity, max(soc, max_soc))
+        # Solar left over after charging (storing draws energy / efficiency)
+        leftover_excess = max(0.0, solar_excess - energy_to_store / efficiency)
+        
+        # ========================================
+        # STEP 3: Meet Remaining Load
+        # ========================================
+        # Branchless: off-peak hours, no deficit or an empty battery make the
+        # min() yield zero. During peak hours the battery is used before grid.
+        peak_factor = 1.0 if is_peak else 0.0
+        # Available battery energy
+        available_energy = max(0.0, (soc - min_soc) * capacity) * peak_factor
+        # Discharge what we can (accounting for efficiency)
+        battery_discharge = min(remaining_load, available_energy * efficiency)
+        # Update battery state, clamped to min (never lifts an under-min SoC up)
+        actual_discharge = battery_discharge / efficiency
+        soc = max(soc - actual_discharge / capacity, min(soc, min_soc))
+        remaining_load -= battery_discharge
+        
+        # Grid fills any remaining deficit
+        grid_usage = max(0.0, remaining_load)
+        
+        solar_used_out[h] = solar_used
+        grid_usage_out[h] = grid_usage
+        battery_charge_out[h] = battery_charge
+        battery_discharge_out[h] = battery_discharge
+        soc_out[h] = soc
+        solar_excess_out[h] = leftover_excess
+    
+    return (base_solar_used_out, base_grid_usage_out, base_battery_charge_out,
+            base_battery_discharge_out, base_soc_out, base_solar_excess_out,
+            solar_used_out, grid_usage_out, battery_charge_out,
+            battery_discharge_out, soc_out, solar_excess_out)
+
+
+_BATCH_PROFILE_ARRAY = types.Array(types.float64, 2, "A", readonly=True)
+_BATCH_PARAM_ARRAY = types.Array(types.float64, 1, "A", readonly=True)
+_BATCH_PEAK_ARRAY = types.Array(types.int64, 1, "A", readonly=True)
+_RUN_BATCH_SIGNATURE = types.float64[:, :, :](
+    _BATCH_PROFILE_ARRAY, _BATCH_PROFILE_ARRAY,
+    _BATCH_PARAM_ARRAY, _BATCH_PARAM_ARRAY, _BATCH_PARAM_ARRAY, _BATCH_PARAM_ARRAY, _BATCH_PARAM_ARRAY,
+    _BATCH_PEAK_ARRAY, _BATCH_PEAK_ARRAY
+)
+
+
+@njit(_RUN_BATCH_SIGNATURE, cache=True)
+def _run_batch(solar, load, soc0, capacity, efficiency, min_soc, max_soc, peak_lo, peak_hi):
+    """
+    Run _run_both for N independent scenarios in one compiled call.
+    
+    Serial on purpose: the kernel is a small share of batch time (result
+    rounding and record building dominate), and a parallel=True kernel
+    entered from several request threads is unsafe under numba's
+    workqueue threading layer.
+    
+    solar/load are (N, hours) profiles; every other argument holds one value
+    per scenario. Returns an (N, 12, hours) array whose second axis follows
+    the _run_both output order.
+    """
+    n, hours = solar.shape
+    out = np.empty((n, 12, hours))
+    for i in range(n):
+        outputs = _run_both(
+            solar[i], load[i], soc0[i], capacity[i], efficiency[i],
+            min_soc[i], max_soc[i], peak_lo[i], peak_hi[i]
+        )
+        for k in range(12):
+            out[i, k, :] = outputs[k]
+    return out
+
+
+@lru_cache(maxsize=32)
+def _solar_profile(solar_capacity_kw: float, weather_mode: str) -> np.ndarray:
+    """
+    Generate realistic solar PV generation profile.
+    
+    Uses a Gaussian-like curve centered at solar noon (12:00-13:00)
+    with zero generation during night hours. Scales by solar_capacity_kw
+    and weather_mode (sunny=100%, cloudy=50%).
+    """
+    # Solar irradiance follows a bell curve during daylight hours
+    # Peak at hour 12 (noon), zero before 6 AM and after 7 PM
+    h = HOURS
+    # Scale peak by solar capacity (base profile assumes 5kW system produces ~7kW peak)
+    capacity_factor = solar_capacity_kw / 5.0
+    peak_generation = 7.0 * capacity_factor
+    
+    # Gaussian curve over daylight hours (6 AM to 6 PM): peak at hour 12, sigma = 3
+    daylight = (h >= 6) & (h <= 18)
+    solar = np.where(daylight, peak_generation * np.exp(-0.5 * ((h - 12) / 3) ** 2), 0.0)
+    
+    # Apply weather efficiency factor
+    weather_efficiency = 1.0 if weather_mode == "sunny" else 0.5
+    solar = solar * weather_efficiency
+    
+    # Add some realistic variation (±10%)
+    solar = solar * (1 + 0.1 * (_SOLAR_NOISE - 0.5))
+    solar = np.maximum(solar, 0)  # Ensure non-negative
+    
+    solar = np.round(solar, 2)
+    solar.setflags(write=False)  # Shared across simulator instances
+    return solar
+
+
+@lru_cache(maxsize=None)
+def _load_profile() -> np.ndarray:
+    """
+    Generate realistic load demand profile for Delhi residential area.
+    
+    Delhi-specific consumption pattern:
+    - Low overnight demand (1.5-2 kW) - fans/AC on low
+    - Morning peak 6-9 AM (3-4 kW) - geysers, appliances
+    - Moderate midday (2.5-3 kW) - AC moderate
+    - Evening peak 6-10 PM (5-7 kW) - AC, lights, TV, cooking
+    - Summer peak load higher due to AC usage
+    """
+    # Delhi residential load pattern (kW) - Summer scenario
+    load = np.array([
+        1.5, 1.5, 1.5, 1.5, 2.0, 2.5,   # 0-5 AM: Night low (fans/AC)
+        3.5, 4.0, 4.5, 3.5, 3.0, 2.5,   # 6-11 AM: Morning (geyser, cooking)
+        2.5, 2.5, 3.0, 3.5, 4.0, 5.0,   # 12-5 PM: Afternoon (AC ramps up)
+        6.5, 7.0, 6.5, 5.5, 4.0, 2.5    # 6-11 PM: Evening peak (AC, lights, TV)
+    ])
+    
+    # Add small random variation (±5%)
+    load = load * (1 + 0.05 * (_LOAD_NOISE - 0.5))
+    
+    load = np.round(load, 2)
+    load.setflags(write=False)  # Shared across simulator instances
+    return load
+
+
+@lru_cache(maxsize=32)
+def _price_profile(off_peak_price: float, standard_price: float, peak_price: float) -> np.ndarray:
+    """
+    Generate 3-tier time-of-use electricity pricing for Delhi.
+    
+    Off-Peak (00:00-06:00): ₹4.00/kWh - Night rates
+    Standard (06:00-18:00): ₹6.50/kWh - Daytime rates
+    Peak (18:00-22:00): ₹8.50/kWh - Evening peak rates
+    """
+    h = HOURS
+    price = np.select(
+        [h < 6, h < 18, h < 22],  # Off-peak 00-06, Standard 06-18, Peak 18-22
+        [off_peak_price, standard_price, peak_price],
+        default=off_peak_price    # Off-peak: 22:00-24:00
+    ).astype(np.float64)
+    
+    price.setflags(write=False)  # Shared across simulator instances
+    return price
+
+
+# Decimal places reported per result column; unlisted columns are passed through
+RESULT_DECIMALS = {
+    "solar_generation": 2,
+    "load_demand": 2,
+    "solar_used": 2,
+    "solar_excess": 2,
+    "grid_usage": 2,
+    "battery_charge": 2,
+    "battery_discharge": 2,
+    "battery_soc": 1,
+    "grid_price": 3,
+    "hourly_cost": 3,
+}
+
+
+def _round_columns(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Round each result column once to its reported precision."""
+    return {
+        key: np.round(col, RESULT_DECIMALS[key]) if key in RESULT_DECIMALS else col
+        for key, col in columns.items()
+    }
+
+
+def _round_total(value: float, decimals: int) -> float:
+    """Round a summary total with NumPy's rounding (as for the hourly columns)."""
+    return float(np.round(value, decimals))
+
+
+def _to_records(columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Convert columnar strategy results into the per-hour records sent to clients."""
+    keys = list(columns)
+    rows = zip(*(col.tolist() for col in columns.values()))
+    return [dict(zip(keys, row)) for row in rows]
+
+
 class MicrogridSimulator:
     """
     Microgrid simulation engine using NumPy for efficient 24-hour energy calculations.
@@ -51,91 +319,66 @@ class MicrogridSimulator:
     def __init__(self, config: SimulationConfig = None):
         """Initialize simulator with configuration parameters."""
         self.config = config or SimulationConfig()
-        self.hours = np.arange(24)  # 0-23 hours
+        self.hours = HOURS  # 0-23 hours (shared, read-only)
         
-        # Generate base profiles
-        self._generate_solar_profile()
-        self._generate_load_profile()
-        self._generate_price_profile()
+        # Base profiles (memoized and read-only, shared between instances)
+        cfg = self.config
+        self.solar_profile = _solar_profile(cfg.solar_capacity_kw, cfg.weather_mode)
+        self.load_profile = _load_profile()
+        self.price_profile = _price_profile(cfg.off_peak_price, cfg.standard_price, cfg.peak_price)
     
-    def _generate_solar_profile(self) -> None:
-        """
-        Generate realistic solar PV generation profile.
-        
-        Uses a Gaussian-like curve centered at solar noon (12:00-13:00)
-        with zero generation during night hours. Scales by solar_capacity_kw
-        and weather_mode (sunny=100%, cloudy=50%).
-        """
-        # Solar irradiance follows a bell curve during daylight hours
-        # Peak at hour 12 (noon), zero before 6 AM and after 7 PM
-        solar = np.zeros(24)
-        # Scale peak by solar capacity (base profile assumes 5kW system produces ~7kW peak)
-        capacity_factor = self.config.solar_capacity_kw / 5.0
-        peak_generation = 7.0 * capacity_factor
-        
-        for h in range(6, 19):  # Daylight hours: 6 AM to 6 PM
-            # Gaussian curve: peak at hour 12, sigma = 3
-            solar[h] = peak_generation * np.exp(-0.5 * ((h - 12) / 3) ** 2)
-        
-        # Apply weather efficiency factor
-        weather_efficiency = 1.0 if self.config.weather_mode == "sunny" else 0.5
-        solar = solar * weather_efficiency
-        
-        # Add some realistic variation (±10%)
-        np.random.seed(42)  # Reproducible results
-        solar = solar * (1 + 0.1 * (np.random.random(24) - 0.5))
-        solar = np.maximum(solar, 0)  # Ensure non-negative
-        
-        self.solar_profile = np.round(solar, 2)
+    def _kernel_args(self) -> tuple:
+        """Profiles and battery/tariff scalars in _run_both argument order."""
+        peak_lo, peak_hi = self.config.peak_hours
+        return (
+            self.solar_profile,
+            self.load_profile,
+            float(self.config.initial_soc),
+            float(self.config.battery_capacity_kwh),
+            float(self.config.battery_efficiency),
+            float(self.config.min_soc),
+            float(self.config.max_soc),
+            int(peak_lo),
+            int(peak_hi)
+        )
     
-    def _generate_load_profile(self) -> None:
+    def _columns(self, outputs) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
         """
-        Generate realistic load demand profile for Delhi residential area.
+        Build result columns from the 12 dispatch kernel output arrays.
         
-        Delhi-specific consumption pattern:
-        - Low overnight demand (1.5-2 kW) - fans/AC on low
-        - Morning peak 6-9 AM (3-4 kW) - geysers, appliances
-        - Moderate midday (2.5-3 kW) - AC moderate
-        - Evening peak 6-10 PM (5-7 kW) - AC, lights, TV, cooking
-        - Summer peak load higher due to AC usage
+        Returns:
+            (baseline, smart) unrounded columns of 24 hourly energy metrics
+            and costs, keyed by field name
         """
-        # Delhi residential load pattern (kW) - Summer scenario
-        load = np.array([
-            1.5, 1.5, 1.5, 1.5, 2.0, 2.5,   # 0-5 AM: Night low (fans/AC)
-            3.5, 4.0, 4.5, 3.5, 3.0, 2.5,   # 6-11 AM: Morning (geyser, cooking)
-            2.5, 2.5, 3.0, 3.5, 4.0, 5.0,   # 12-5 PM: Afternoon (AC ramps up)
-            6.5, 7.0, 6.5, 5.5, 4.0, 2.5    # 6-11 PM: Evening peak (AC, lights, TV)
-        ])
+        peak_lo, peak_hi = self.config.peak_hours
+        is_peak = (self.hours >= peak_lo) & (self.hours < peak_hi)
         
-        # Add small random variation (±5%)
-        np.random.seed(43)
-        load = load * (1 + 0.05 * (np.random.random(24) - 0.5))
+        strategies = []
+        for solar_used, grid_usage, battery_charge, battery_discharge, soc, solar_excess in (
+            outputs[:6], outputs[6:]
+        ):
+            strategies.append({
+                "hour": self.hours,
+                "solar_generation": self.solar_profile,
+                "load_demand": self.load_profile,
+                "solar_used": solar_used,
+                "solar_excess": solar_excess,
+                "grid_usage": grid_usage,
+                "battery_charge": battery_charge,
+                "battery_discharge": battery_discharge,
+                "battery_soc": soc * 100,  # Percentage
+                "grid_price": self.price_profile,
+                "hourly_cost": grid_usage * self.price_profile,
+                "is_peak_hour": is_peak
+            })
         
-        self.load_profile = np.round(load, 2)
+        return strategies[0], strategies[1]
     
-    def _generate_price_profile(self) -> None:
-        """
-        Generate 3-tier time-of-use electricity pricing for Delhi.
-        
-        Off-Peak (00:00-06:00): ₹4.00/kWh - Night rates
-        Standard (06:00-18:00): ₹6.50/kWh - Daytime rates
-        Peak (18:00-22:00): ₹8.50/kWh - Evening peak rates
-        """
-        price = np.zeros(24)
-        
-        for h in range(24):
-            if h < 6:  # Off-peak: 00:00-06:00
-                price[h] = self.config.off_peak_price
-            elif h < 18:  # Standard: 06:00-18:00
-                price[h] = self.config.standard_price
-            elif h < 22:  # Peak: 18:00-22:00
-                price[h] = self.config.peak_price
-            else:  # Off-peak: 22:00-24:00
-                price[h] = self.config.off_peak_price
-        
-        self.price_profile = price
+    def _simulate(self) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """Run both strategies through the fused dispatch kernel."""
+        return self._columns(_run_both(*self._kernel_args()))
     
-    def simulate_baseline(self) -> List[Dict[str, Any]]:
+    def simulate_baseline(self) -> Dict[str, np.ndarray]:
         """
         Run baseline strategy simulation.
         
@@ -146,41 +389,11 @@ class MicrogridSimulator:
         - Excess solar is wasted (no storage)
         
         Returns:
-            List of 24 hourly records with energy metrics and costs
+            Unrounded columns of 24 hourly energy metrics and costs, keyed by field name
         """
-        results = []
-        
-        for hour in range(24):
-            solar = self.solar_profile[hour]
-            load = self.load_profile[hour]
-            price = self.price_profile[hour]
-            
-            # Energy balance: Solar meets load, grid fills deficit
-            solar_used = min(solar, load)
-            grid_usage = max(0, load - solar)
-            solar_excess = max(0, solar - load)  # Wasted in baseline
-            
-            # Cost calculation
-            cost = grid_usage * price
-            
-            results.append({
-                "hour": int(hour),
-                "solar_generation": round(solar, 2),
-                "load_demand": round(load, 2),
-                "solar_used": round(solar_used, 2),
-                "solar_excess": round(solar_excess, 2),
-                "grid_usage": round(grid_usage, 2),
-                "battery_charge": 0.0,
-                "battery_discharge": 0.0,
-                "battery_soc": round(self.config.initial_soc * 100, 1),  # Static SoC
-                "grid_price": round(price, 3),
-                "hourly_cost": round(cost, 3),
-                "is_peak_hour": bool(self.config.peak_hours[0] <= hour < self.config.peak_hours[1])
-            })
-        
-        return results
+        return self._simulate()[0]
     
-    def simulate_smart(self) -> List[Dict[str, Any]]:
+    def simulate_smart(self) -> Dict[str, np.ndarray]:
         """
         Run smart scheduling strategy simulation.
         
@@ -199,89 +412,9 @@ class MicrogridSimulator:
         expensive peak hours by utilizing stored solar energy.
         
         Returns:
-            List of 24 hourly records with energy metrics and costs
+            Unrounded columns of 24 hourly energy metrics and costs, keyed by field name
         """
-        results = []
-        
-        # Battery state tracking
-        soc = self.config.initial_soc  # Current State of Charge (0-1)
-        capacity = self.config.battery_capacity_kwh
-        efficiency = self.config.battery_efficiency
-        min_soc = self.config.min_soc
-        max_soc = self.config.max_soc
-        
-        for hour in range(24):
-            solar = self.solar_profile[hour]
-            load = self.load_profile[hour]
-            price = self.price_profile[hour]
-            is_peak = self.config.peak_hours[0] <= hour < self.config.peak_hours[1]
-            
-            # Initialize hourly values
-            solar_used = 0.0
-            grid_usage = 0.0
-            battery_charge = 0.0
-            battery_discharge = 0.0
-            
-            # ========================================
-            # STEP 1: Direct Solar to Load
-            # ========================================
-            solar_used = min(solar, load)
-            remaining_load = load - solar_used
-            solar_excess = max(0, solar - load)
-            
-            # ========================================
-            # STEP 2: Handle Solar Excess (Charge Battery)
-            # ========================================
-            if solar_excess > 0 and soc < max_soc:
-                # Calculate available storage capacity
-                available_capacity = (max_soc - soc) * capacity
-                # Energy that can be stored (accounting for efficiency)
-                energy_to_store = min(solar_excess * efficiency, available_capacity)
-                # Update battery state
-                battery_charge = energy_to_store
-                soc += energy_to_store / capacity
-                soc = min(soc, max_soc)  # Clamp to max
-            
-            # ========================================
-            # STEP 3: Meet Remaining Load
-            # ========================================
-            if remaining_load > 0:
-                # During peak hours: Prioritize battery discharge
-                if is_peak and soc > min_soc:
-                    # Available battery energy
-                    available_energy = (soc - min_soc) * capacity
-                    # Discharge what we can (accounting for efficiency)
-                    battery_discharge = min(remaining_load, available_energy * efficiency)
-                    # Update battery state
-                    actual_discharge = battery_discharge / efficiency
-                    soc -= actual_discharge / capacity
-                    soc = max(soc, min_soc)  # Clamp to min
-                    remaining_load -= battery_discharge
-                
-                # Grid fills any remaining deficit
-                grid_usage = max(0, remaining_load)
-            
-            # ========================================
-            # STEP 4: Calculate Hourly Cost
-            # ========================================
-            cost = grid_usage * price
-            
-            results.append({
-                "hour": int(hour),
-                "solar_generation": round(solar, 2),
-                "load_demand": round(load, 2),
-                "solar_used": round(solar_used, 2),
-                "solar_excess": round(max(0, solar - load - battery_charge), 2),
-                "grid_usage": round(grid_usage, 2),
-                "battery_charge": round(battery_charge, 2),
-                "battery_discharge": round(battery_discharge, 2),
-                "battery_soc": round(soc * 100, 1),  # Percentage
-                "grid_price": round(price, 3),
-                "hourly_cost": round(cost, 3),
-                "is_peak_hour": bool(is_peak)
-            })
-        
-        return results
+        return self._simulate()[1]
     
     def run_comparison(self) -> Dict[str, Any]:
         """
@@ -293,34 +426,44 @@ class MicrogridSimulator:
             - smart_data: 24-hour smart strategy results
             - summary: Cost comparison and savings metrics
         """
-        baseline_results = self.simulate_baseline()
-        smart_results = self.simulate_smart()
-        
-        # Calculate totals
-        baseline_total_cost = sum(r["hourly_cost"] for r in baseline_results)
-        smart_total_cost = sum(r["hourly_cost"] for r in smart_results)
+        return self._compare(*self._simulate())
+    
+    def _compare(self, baseline: Dict[str, np.ndarray], smart: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """Round both strategies' columns and assemble the comparison payload."""
+        baseline_results = _round_columns(baseline)
+        smart_results = _round_columns(smart)
         
-        baseline_grid_usage = sum(r["grid_usage"] for r in baseline_results)
-        smart_grid_usage = sum(r["grid_usage"] for r in smart_results)
+        # Calculate totals (one row-wise reduction over the four columns).
+        # accumulate adds hour by hour, left to right, matching a plain
+        # running sum; .sum() would use pairwise summation and shift ties.
+        baseline_total_cost, smart_total_cost, baseline_grid_usage, smart_grid_usage = np.add.accumulate(
+            np.stack([
+                baseline_results["hourly_cost"],
+                smart_results["hourly_cost"],
+                baseline_results["grid_usage"],
+                smart_results["grid_usage"]
+            ]),
+            axis=1
+        )[:, -1]
         
         cost_saved = baseline_total_cost - smart_total_cost
-        cost_saved_percent = (cost_saved / baseline_total_cost * 100) if baseline_total_cost > 0 else 0
+        cost_saved_percent = (cost_saved / baseline_total_cost * 100) if baseline_total_cost > 0 else 0.0
         
         grid_reduced = baseline_grid_usage - smart_grid_usage
-        grid_reduced_percent = (grid_reduced / baseline_grid_usage * 100) if baseline_grid_usage > 0 else 0
+        grid_reduced_percent = (grid_reduced / baseline_grid_usage * 100) if baseline_grid_usage > 0 else 0.0
         
         return {
-            "baseline_data": baseline_results,
-            "smart_data": smart_results,
+            "baseline_data": _to_records(baseline_results),
+            "smart_data": _to_records(smart_results),
             "summary": {
-                "baseline_total_cost": round(baseline_total_cost, 2),
-                "smart_total_cost": round(smart_total_cost, 2),
-                "cost_saved": round(cost_saved, 2),
-                "cost_saved_percent": round(cost_saved_percent, 1),
-                "baseline_grid_usage": round(baseline_grid_usage, 2),
-                "smart_grid_usage": round(smart_grid_usage, 2),
-                "grid_reduced": round(grid_reduced, 2),
-                "grid_reduced_percent": round(grid_reduced_percent, 1),
+                "baseline_total_cost": _round_total(baseline_total_cost, 2),
+                "smart_total_cost": _round_total(smart_total_cost, 2),
+                "cost_saved": _round_total(cost_saved, 2),
+                "cost_saved_percent": _round_total(cost_saved_percent, 1),
+                "baseline_grid_usage": _round_total(baseline_grid_usage, 2),
+                "smart_grid_usage": _round_total(smart_grid_usage, 2),
+                "grid_reduced": _round_total(grid_reduced, 2),
+                "grid_reduced_percent": _round_total(grid_reduced_percent, 1),
                 "battery_capacity_kwh": self.config.battery_capacity_kwh,
                 "peak_price": self.config.peak_price,
                 "off_peak_price": self.config.off_peak_price
@@ -328,6 +471,31 @@ class MicrogridSimulator:
         }
 
 
+def simulate_batch(configs: List[SimulationConfig]) -> List[Dict[str, Any]]:
+    """
+    Run the baseline vs smart comparison for many configurations at once.
+    
+    All scenarios go through the dispatch kernel in one compiled call.
+    Results match run_comparison() for each config, in order.
+    """
+    if not configs:
+        return []
+    
+    simulators = [MicrogridSimulator(config) for config in configs]
+    columns = list(zip(*(simulator._kernel_args() for simulator in simulators)))
+    arrays = [np.stack(columns[0]), np.stack(columns[1])]
+    arrays += [np.array(col, dtype=np.float64) for col in columns[2:7]]
+    arrays += [np.array(col, dtype=np.int64) for col in columns[7:]]
+    for arr in arrays:
+        arr.setflags(write=False)
+    
+    outputs = _run_batch(*arrays)
+    return [
+        simulator._compare(*simulator._columns(tuple(out)))
+        for simulator, out in zip(simulators, outputs)
+    ]
+
+
 # Utility function for quick testing
 if __name__ == "__main__":
     simulator = MicrogridSimulator()
@@ -0,0 +1,127 @@
+"""
+Microgrid Digital Twin - Simulation Engine Tests
+================================================
+Pins the compiled dispatch kernel against a plain-Python reference of the
+dispatch rules, plus a few end-to-end summary values.
+
+Run from the backend directory with: python -m pytest
+"""
+
+import numpy as np
+import pytest
+
+from simulation import MicrogridSimulator, SimulationConfig, _run_both, simulate_batch
+
+
+# Configs covering the SoC bounds, small/large batteries and cloudy weather
+CONFIGS = [
+    SimulationConfig(),
+    SimulationConfig(initial_soc=0.20),                                  # At min_soc
+    SimulationConfig(initial_soc=1.00),                                  # At max_soc
+    SimulationConfig(weather_mode="cloudy", initial_soc=0.20),
+    SimulationConfig(weather_mode="cloudy", solar_capacity_kw=3.0, battery_capacity_kwh=1.0),
+    SimulationConfig(solar_capacity_kw=7.0, battery_capacity_kwh=5.0, initial_soc=1.00),
+    SimulationConfig(battery_capacity_kwh=100.0, peak_price=15.0, off_peak_price=2.0),
+]
+
+
+def _reference_dispatch(solar, load, config):
+    """Branchy per-hour dispatch rules the kernel must reproduce."""
+    soc = config.initial_soc
+    capacity = config.battery_capacity_kwh
+    efficiency = config.battery_efficiency
+    base = [[] for _ in range(6)]
+    smart = [[] for _ in range(6)]
+    
+    for h in range(len(solar)):
+        is_peak = config.peak_hours[0] <= h < config.peak_hours[1]
+        solar_used = min(solar[h], load[h])
+        remaining_load = load[h] - solar_used
+        solar_excess = max(0.0, solar[h] - load[h])
+        
+        for col, value in zip(base, (solar_used, remaining_load, 0.0, 0.0, config.initial_soc, solar_excess)):
+            col.append(value)
+        
+        battery_charge = 0.0
+        battery_discharge = 0.0
+        grid_usage = 0.0
+        leftover_excess = solar_excess
+        
+        if solar_excess > 0 and soc < config.max_soc:
+            available_capacity = (config.max_soc - soc) * capacity
+            battery_charge = min(solar_excess * efficiency, available_capacity)
+            soc = min(soc + battery_charge / capacity, config.max_soc)
+            leftover_excess = max(0.0, solar_excess - battery_charge / efficiency)
+        
+        if remaining_load > 0:
+            if is_peak and soc > config.min_soc:
+                available_energy = (soc - config.min_soc) * capacity
+                battery_discharge = min(remaining_load, available_energy * efficiency)
+                soc = max(soc - battery_discharge / efficiency / capacity, config.min_soc)
+                remaining_load -= battery_discharge
+            grid_usage = max(0.0, remaining_load)
+        
+        for col, value in zip(smart, (solar_used, grid_usage, battery_charge, battery_discharge, soc, leftover_excess)):
+            col.append(value)
+    
+    return [np.array(col) for col in base + smart]
+
+
+# ============================================
+# Dispatch Kernel
+# ============================================
+@pytest.mark.parametrize("config", CONFIGS)
+def test_kernel_matches_reference_dispatch(config):
+    simulator = MicrogridSimulator(config)
+    outputs = _run_both(*simulator._kernel_args())
+    expected = _reference_dispatch(simulator.solar_profile, simulator.load_profile, config)
+    
+    assert len(outputs) == 12
+    for actual, reference in zip(outputs, expected):
+        np.testing.assert_allclose(actual, reference, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_soc_stays_within_bounds(config):
+    smart = MicrogridSimulator(config).simulate_smart()
+    soc = smart["battery_soc"] / 100
+    assert np.all(soc >= config.min_soc - 1e-12)
+    assert np.all(soc <= config.max_soc + 1e-12)
+
+
+# ============================================
+# Comparison Results
+# ============================================
+@pytest.mark.parametrize("config, expected", [
+    (SimulationConfig(), {
+        "baseline_total_cost": 349.69, "smart_total_cost": 285.09,
+        "baseline_grid_usage": 52.73, "smart_grid_usage": 45.13,
+    }),
+    (SimulationConfig(weather_mode="cloudy", initial_soc=0.20), {
+        "baseline_total_cost": 407.61, "smart_total_cost": 385.13,
+        "baseline_grid_usage": 61.49, "smart_grid_usage": 58.85,
+    }),
+    (SimulationConfig(battery_capacity_kwh=5.0, initial_soc=1.00), {
+        "baseline_total_cost": 349.69, "smart_total_cost": 317.39,
+        "baseline_grid_usage": 52.73, "smart_grid_usage": 48.93,
+    }),
+])
+def test_run_comparison_summary(config, expected):
+    summary = MicrogridSimulator(config).run_comparison()["summary"]
+    for key, value in expected.items():
+        assert summary[key] == value
+
+
+def test_run_comparison_records():
+    results = MicrogridSimulator().run_comparison()
+    for key in ("baseline_data", "smart_data"):
+        records = results[key]
+        assert [r["hour"] for r in records] == list(range(24))
+        assert all(type(r["is_peak_hour"]) is bool for r in records)
+        assert [r["is_peak_hour"] for r in records].count(True) == 4
+    assert all(r["battery_charge"] == 0.0 for r in results["baseline_data"])
+
+
+def test_simulate_batch_matches_run_comparison():
+    assert simulate_batch(CONFIGS) == [MicrogridSimulator(c).run_comparison() for c in CONFIGS]
+    assert simulate_batch([]) == []